@@ -0,0 +1,97 @@
+"""Early adjudication (resignation) for self-play games.
+
+Long, lopsided games dominate self-play cost. After each search we look at
+the MCTS root value; once it stays beyond `resign_threshold` for the same
+side over `resign_plies` consecutive plies, the game is scored as a win for
+that side and stopped. A fraction of games (`resign_playthrough_frac`) keeps
+playing to the end anyway, so we can measure how often resigning would have
+produced the wrong label (the false-resign rate).
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Optional
+
+from .game import PLAYER_S
+
+
+@dataclass
+class AdjudicationStats:
+    """Per-iteration counters, shared across all games of one self-play round."""
+
+    games: int = 0
+    plies: int = 0
+    adjudicated: int = 0
+    playthrough_games: int = 0
+    playthrough_would_resign: int = 0
+    false_resigns: int = 0
+
+    @property
+    def false_resign_rate(self) -> float:
+        if self.playthrough_would_resign == 0:
+            return 0.0
+        return self.false_resigns / self.playthrough_would_resign
+
+    def summary(self) -> str:
+        avg_plies = self.plies / self.games if self.games else 0.0
+        return (
+            f"adjudicated {self.adjudicated}/{self.games} games, "
+            f"avg plies {avg_plies:.1f}, "
+            f"false-resign rate {self.false_resign_rate:.1%} "
+            f"({self.false_resigns}/{self.playthrough_would_resign} over {self.playthrough_games} playthrough games)"
+        )
+
+
+class Adjudicator:
+    """Tracks root values for one game and decides when it can be called."""
+
+    def __init__(self, config, rng: Optional[random.Random] = None):
+        self.config = config
+        rng = rng or random
+        self.enabled = config.resign_enabled
+        self.playthrough = self.enabled and rng.random() < config.resign_playthrough_frac
+        self.verdict: Optional[int] = None  # first adjudication, +1 South / -1 North
+        self._streak_sign = 0
+        self._streak = 0
+
+    def observe(self, root_value: float, player: str) -> Optional[int]:
+        """Feed the root value (from `player`'s perspective) after a search.
+
+        Returns the adjudicated outcome (+1 South wins, -1 North wins) when the
+        game should stop now, otherwise None. Playthrough games never stop early.
+        """
+        if not self.enabled:
+            return None
+        value = root_value if player == PLAYER_S else -root_value
+        sign = 0
+        if value >= self.config.resign_threshold:
+            sign = 1
+        elif value <= -self.config.resign_threshold:
+            sign = -1
+
+        if sign != 0 and sign == self._streak_sign:
+            self._streak += 1
+        else:
+            self._streak_sign = sign
+            self._streak = 1 if sign else 0
+
+        if self._streak < self.config.resign_plies:
+            return None
+        if self.verdict is None:
+            self.verdict = self._streak_sign
+        return None if self.playthrough else self.verdict
+
+    def record(self, stats: AdjudicationStats, outcome: int, plies: int, adjudicated: bool) -> None:
+        stats.games += 1
+        stats.plies += plies
+        if adjudicated:
+            stats.adjudicated += 1
+        if self.playthrough:
+            stats.playthrough_games += 1
+            if self.verdict is not None:
+                stats.playthrough_would_resign += 1
+                # A draw also counts: the "losing" side would have been scored a loss it didn't take.
+                if outcome != self.verdict:
+                    stats.false_resigns += 1
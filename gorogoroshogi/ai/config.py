@@ -23,11 +23,19 @@ class Config:
     max_moves: int = 240
     temperature_moves: int = 20
 
+    # Adjudication: stop once the root value stays beyond the threshold for K plies
+    resign_enabled: bool = True
+    resign_threshold: float = 0.9
+    resign_plies: int = 8
+    resign_playthrough_frac: float = 0.1  # games played out anyway to measure false resigns
+
     # Training
     batch_size: int = 128
     epochs: int = 2
     learning_rate: float = 1e-3
     weight_decay: float = 1e-4
+    prefetch_depth: int = 4  # batches assembled ahead of the optimizer
+    loader_workers: int = 2
 
     # Checkpoints
     checkpoint_dir: str = "checkpoints"
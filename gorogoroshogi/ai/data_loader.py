@@ -0,0 +1,162 @@
+"""Background batch prefetching for the training loop.
+
+Worker threads sample from the replay buffer and copy each batch into a
+fixed pool of preallocated (pinned, when CUDA is available) tensors while
+the optimizer works on the previous batch. Buffers are recycled, so no
+per-step tensor allocation happens after construction.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Iterator, List, Optional, Tuple
+
+import torch
+
+from .game import COLS, NUM_PLANES, ROWS
+from .replay_buffer import ReplayBuffer
+
+Batch = Tuple[torch.Tensor, torch.Tensor, torch.Tensor]
+
+
+class _Slot:
+    """One reusable set of batch tensors."""
+
+    def __init__(self, batch_size: int, action_size: int, pin: bool):
+        self.states = torch.empty((batch_size, NUM_PLANES, ROWS, COLS), dtype=torch.float32, pin_memory=pin)
+        self.policies = torch.empty((batch_size, action_size), dtype=torch.float32, pin_memory=pin)
+        self.values = torch.empty((batch_size, 1), dtype=torch.float32, pin_memory=pin)
+        # Numpy views share storage with the tensors, so filling them is a plain memcpy.
+        self._states_np = self.states.numpy()
+        self._policies_np = self.policies.numpy()
+        self._values_np = self.values.numpy()
+        self.size = 0
+        # Marks completion of the async host->device copies issued by `view`.
+        self._copied: Optional[torch.cuda.Event] = None
+
+    def fill(self, batch: List[Tuple]) -> None:
+        if self._copied is not None:
+            # The GPU may still be reading the pinned buffers; don't overwrite them mid-copy.
+            self._copied.synchronize()
+            self._copied = None
+        for i, (planes, policy, value) in enumerate(batch):
+            self._states_np[i] = planes
+            self._policies_np[i] = policy
+            self._values_np[i, 0] = value
+        self.size = len(batch)
+
+    def view(self, device: torch.device) -> Batch:
+        n = self.size
+        non_blocking = self.states.is_pinned() and device.type == "cuda"
+        batch = (
+            self.states[:n].to(device, non_blocking=non_blocking),
+            self.policies[:n].to(device, non_blocking=non_blocking),
+            self.values[:n].to(device, non_blocking=non_blocking),
+        )
+        if non_blocking:
+            self._copied = torch.cuda.Event()
+            self._copied.record()
+        return batch
+
+
+class PrefetchLoader:
+    """Yields `num_batches` training batches assembled in background threads.
+
+    `prefetch_depth` bounds how many batches may be ready ahead of the
+    consumer; it is also the number of preallocated buffer slots (plus one
+    for the batch currently in use by the optimizer).
+    """
+
+    def __init__(
+        self,
+        buffer: ReplayBuffer,
+        batch_size: int,
+        action_size: int,
+        num_batches: int,
+        prefetch_depth: int = 4,
+        num_workers: int = 2,
+        device: Optional[torch.device] = None,
+    ):
+        self.buffer = buffer
+        self.batch_size = batch_size
+        self.num_batches = num_batches
+        self.num_workers = max(1, num_workers)
+        self.device = device or torch.device("cpu")
+
+        pin = torch.cuda.is_available() and self.device.type == "cuda"
+        self._slots = [_Slot(batch_size, action_size, pin) for _ in range(max(1, prefetch_depth) + 1)]
+
+        self._free: "queue.Queue[int]" = queue.Queue()
+        self._ready: "queue.Queue[Optional[int]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._remaining = 0
+        self._stop = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._threads: List[threading.Thread] = []
+
+    def __iter__(self) -> Iterator[Batch]:
+        self._start()
+        in_use: Optional[int] = None
+        try:
+            for _ in range(self.num_batches):
+                idx = self._ready.get()
+                if idx is None:
+                    # A worker failed; surface it instead of quietly running fewer steps.
+                    raise self._error  # type: ignore[misc]
+                if in_use is not None:
+                    self._free.put(in_use)
+                in_use = idx
+                yield self._slots[idx].view(self.device)
+        finally:
+            self._shutdown()
+
+    def _start(self) -> None:
+        self._stop.clear()
+        self._error = None
+        self._remaining = self.num_batches
+        self._free = queue.Queue()
+        self._ready = queue.Queue()
+        for idx in range(len(self._slots)):
+            self._free.put(idx)
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"prefetch-{i}", daemon=True)
+            for i in range(self.num_workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _claim(self) -> bool:
+        with self._lock:
+            if self._remaining <= 0:
+                return False
+            self._remaining -= 1
+            return True
+
+    def _worker(self) -> None:
+        while not self._stop.is_set() and self._claim():
+            idx = self._next_free_slot()
+            if idx is None:
+                return
+            try:
+                self._slots[idx].fill(self.buffer.sample(self.batch_size))
+            except BaseException as exc:
+                # Hand the error to the consumer (re-raised in __iter__) rather than leaving it waiting.
+                self._error = exc
+                self._ready.put(None)
+                return
+            self._ready.put(idx)
+
+    def _next_free_slot(self) -> Optional[int]:
+        while not self._stop.is_set():
+            try:
+                return self._free.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return None
+
+    def _shutdown(self) -> None:
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
@@ -29,6 +29,10 @@ PAWN_ROWS = {PLAYER_N: 2, PLAYER_S: 3}  # chicks meet in the middle
 ROWS = 6
 COLS = 5
 
+# Piece planes per side in `to_planes` order, then one turn plane.
+PLANE_PIECE_TYPES = [PIECE_LION, PIECE_DOG, PIECE_CAT, PIECE_PAWN, PIECE_HEN, PIECE_SUPER_CAT]
+NUM_PLANES = len(PLANE_PIECE_TYPES) * 2 + 1
+
 
 @dataclass(frozen=True)
 class Move:
@@ -258,8 +262,8 @@ class GameState:
 
         Order: [S-L, S-D, S-C, S-P, S-H, S-U, N-L, N-D, N-C, N-P, N-H, N-U, turn]
         """
-        types = [PIECE_LION, PIECE_DOG, PIECE_CAT, PIECE_PAWN, PIECE_HEN, PIECE_SUPER_CAT]
-        planes = [[[0 for _ in range(COLS)] for _ in range(ROWS)] for _ in range(len(types) * 2 + 1)]
+        types = PLANE_PIECE_TYPES
+        planes = [[[0 for _ in range(COLS)] for _ in range(ROWS)] for _ in range(NUM_PLANES)]
         for r in range(ROWS):
             for c in range(COLS):
                 cell = self.board[r][c]
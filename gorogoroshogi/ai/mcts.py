@@ -28,6 +28,8 @@ class Node:
 class MCTS:
     def __init__(self, config):
         self.config = config
+        # Root value from the last search, from the perspective of the player to move.
+        self.last_root_value = 0.0
 
     def search(self, state: GameState, model) -> np.ndarray:
         root = Node(prior=0.0)
@@ -54,6 +56,7 @@ class MCTS:
 
             self._backpropagate(search_path, value)
 
+        self.last_root_value = root.value()
         return self._build_policy(root)
 
     def _select_child(self, node: Node) -> Tuple[int, Node]:
@@ -7,11 +7,13 @@ import torch
 import torch.nn as nn
 import torch.nn.functional as F
 
+from .game import NUM_PLANES
+
 
 class PolicyValueNet(nn.Module):
     def __init__(self, action_size: int, channels: int = 64):
         super().__init__()
-        self.conv1 = nn.Conv2d(13, channels, kernel_size=3, padding=1)
+        self.conv1 = nn.Conv2d(NUM_PLANES, channels, kernel_size=3, padding=1)
         self.conv2 = nn.Conv2d(channels, channels, kernel_size=3, padding=1)
         self.conv3 = nn.Conv2d(channels, channels, kernel_size=3, padding=1)
 
@@ -2,23 +2,27 @@
 
 from __future__ import annotations
 
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import numpy as np
 import random
 
+from .adjudication import AdjudicationStats, Adjudicator
 from .game import GameState
 from .mcts import MCTS
 
 
-def play_game(config, model) -> List[Tuple]:
+def play_game(config, model, stats: Optional[AdjudicationStats] = None) -> List[Tuple]:
     """Runs one self-play game and returns training samples.
 
     Each sample: (state_planes, policy, value)
     value is from the perspective of the player to move at that state.
+    Games may end early by adjudication; pass `stats` to collect counters.
     """
     state = GameState.initial()
     mcts = MCTS(config)
+    adjudicator = Adjudicator(config)
+    adjudicated = False
     history = []
 
     while True:
@@ -30,6 +34,11 @@ def play_game(config, model) -> List[Tuple]:
             break
 
         policy = mcts.search(state, model)
+        verdict = adjudicator.observe(mcts.last_root_value, state.turn)
+        if verdict is not None:
+            outcome = verdict
+            adjudicated = True
+            break
         temp = 1.0 if state.move_number <= config.temperature_moves else 0.0
         action = select_action(policy, temp)
         if action is None:
@@ -40,6 +49,9 @@ def play_game(config, model) -> List[Tuple]:
         history.append((state.to_planes(), policy, state.turn))
         state = state.apply_move(GameState.action_to_move(action))
 
+    if stats is not None:
+        adjudicator.record(stats, outcome, len(history), adjudicated)
+
     samples = []
     for planes, policy, player in history:
         value = outcome if player == "S" else -outcome
@@ -9,21 +9,24 @@ from __future__ import annotations
 import os
 from typing import List, Tuple
 
-import numpy as np
 import torch
 import torch.nn.functional as F
 
+from .adjudication import AdjudicationStats
 from .config import Config
+from .data_loader import PrefetchLoader
 from .game import GameState
 from .model import PolicyValueNet
 from .replay_buffer import ReplayBuffer
 from .self_play import play_game
 
 
-def run_self_play(config: Config, model: PolicyValueNet, buffer: ReplayBuffer):
+def run_self_play(config: Config, model: PolicyValueNet, buffer: ReplayBuffer) -> AdjudicationStats:
+    stats = AdjudicationStats()
     for _ in range(config.games_per_iteration):
-        samples = play_game(config, model)
+        samples = play_game(config, model, stats)
         buffer.add_game(samples)
+    return stats
 
 
 def train_model(config: Config, model: PolicyValueNet, buffer: ReplayBuffer):
@@ -34,15 +37,19 @@ def train_model(config: Config, model: PolicyValueNet, buffer: ReplayBuffer):
         model.parameters(), lr=config.learning_rate, weight_decay=config.weight_decay
     )
 
-    model.train()
-    for _ in range(config.epochs):
-        batch = buffer.sample(config.batch_size)
-        states, target_policies, target_values = zip(*batch)
-
-        states = torch.from_numpy(np.stack(states)).float()
-        target_policies = torch.from_numpy(np.stack(target_policies)).float()
-        target_values = torch.tensor(target_values, dtype=torch.float32).unsqueeze(1)
+    device = next(model.parameters()).device
+    loader = PrefetchLoader(
+        buffer,
+        batch_size=config.batch_size,
+        action_size=config.action_size,
+        num_batches=config.epochs,
+        prefetch_depth=config.prefetch_depth,
+        num_workers=config.loader_workers,
+        device=device,
+    )
 
+    model.train()
+    for states, target_policies, target_values in loader:
         logits, values = model(states)
         policy_loss = -(target_policies * F.log_softmax(logits, dim=1)).sum(dim=1).mean()
         value_loss = F.mse_loss(values, target_values)
@@ -66,10 +73,11 @@ def main():
 
     # Minimal loop: self-play -> train -> checkpoint.
     for iteration in range(1, 6):
-        run_self_play(config, model, buffer)
+        stats = run_self_play(config, model, buffer)
         train_model(config, model, buffer)
         save_checkpoint(config, model, iteration)
         print(f"Iteration {iteration} complete. Buffer size: {len(buffer)}")
+        print(f"  Self-play: {stats.summary()}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Benchmark the reference solvers over many seeded mazes.
+
+For every (size, seed) the maze and its goal-distance field come from the
+server's cached generators; each solver's route is checked for validity and
+its length compared to the optimum. Example:
+
+    python3 bench_solvers.py --seeds 2000 --sizes 10,25,50 --algorithm carved
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from typing import Dict, List
+
+from server import ALGORITHMS, WALL_DENSITY, _generate_grid, _goal_distances
+from solvers import SOLVERS
+
+_DELTAS = {"U": (0, -1), "D": (0, 1), "L": (-1, 0), "R": (1, 0)}
+
+
+def _is_valid_route(grid, route: str) -> bool:
+    size = len(grid)
+    x = y = 0
+    for letter in route:
+        dx, dy = _DELTAS[letter]
+        x, y = x + dx, y + dy
+        if not (0 <= x < size and 0 <= y < size) or grid[y][x] == "#":
+            return False
+    return (x, y) == (size - 1, size - 1)
+
+
+def run(sizes: List[int], seeds: int, algorithm: str, wall_density: float = WALL_DENSITY) -> None:
+    print(f"algorithm={algorithm} density={wall_density} seeds={seeds}")
+    print(f"{'size':>6} {'solver':>14} {'mean us':>10} {'p99 us':>10} {'steps/opt':>10} {'failures':>9}")
+    for size in sizes:
+        mazes = [
+            (_generate_grid(seed, size, algorithm, wall_density), _goal_distances(seed, size, algorithm, wall_density)[0])
+            for seed in range(seeds)
+        ]
+        for name, solver in SOLVERS.items():
+            times: List[float] = []
+            ratios: List[float] = []
+            failures = 0
+            for grid, optimal in mazes:
+                t0 = time.perf_counter()
+                route = solver(grid)
+                times.append(time.perf_counter() - t0)
+                if route is None or not _is_valid_route(grid, route):
+                    failures += 1
+                    continue
+                ratios.append(len(route) / optimal if optimal else 1.0)
+            times.sort()
+            p99 = times[min(len(times) - 1, int(0.99 * len(times)))]
+            ratio = statistics.fmean(ratios) if ratios else float("nan")
+            print(
+                f"{size:>6} {name:>14} {statistics.fmean(times) * 1e6:>10.1f} "
+                f"{p99 * 1e6:>10.1f} {ratio:>10.3f} {failures:>9}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seeds", type=int, default=1000, help="mazes per size")
+    parser.add_argument("--sizes", default="10,25,50", help="comma-separated maze sizes")
+    parser.add_argument("--algorithm", default="carved", choices=ALGORITHMS)
+    parser.add_argument("--density", type=float, default=WALL_DENSITY, help="target wall fraction")
+    args = parser.parse_args()
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    run(sizes, args.seeds, args.algorithm, args.density)
+
+
+if __name__ == "__main__":
+    main()
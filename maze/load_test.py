@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Hammer a running maze server with concurrent agents and report throughput.
+
+Each worker opens its own session via /api/new and then issues random moves
+against it. Start the server first (`python3 server.py`), then e.g.:
+
+    python3 load_test.py --agents 32 --requests 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import random
+import threading
+import time
+from typing import List
+from urllib.parse import urlparse
+
+DIRECTIONS = ("up", "down", "left", "right")
+
+
+def _agent(base: str, requests: int, seed: int, latencies: List[float], errors: List[int]) -> None:
+    url = urlparse(base)
+    conn = http.client.HTTPConnection(url.hostname, url.port or 80, timeout=30)
+    rng = random.Random(seed)
+
+    def get(path: str) -> dict:
+        t0 = time.perf_counter()
+        conn.request("GET", path)
+        res = conn.getresponse()
+        body = res.read()
+        latencies.append(time.perf_counter() - t0)
+        if res.status != 200:
+            errors.append(res.status)
+            return {}
+        return json.loads(body)
+
+    session = get(f"/api/new?seed={seed}").get("session", "")
+    for _ in range(requests - 1):
+        get(f"/api/move?session={session}&dir={rng.choice(DIRECTIONS)}")
+    conn.close()
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--agents", type=int, default=32, help="concurrent sessions")
+    parser.add_argument("--requests", type=int, default=200, help="requests per agent")
+    args = parser.parse_args()
+
+    latencies: List[float] = []
+    errors: List[int] = []
+    threads = [
+        threading.Thread(target=_agent, args=(args.url, args.requests, i, latencies, errors))
+        for i in range(args.agents)
+    ]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    total = len(latencies)
+    print(f"agents={args.agents} requests={total} errors={len(errors)} elapsed={elapsed:.2f}s")
+    print(f"throughput: {total / elapsed:.1f} req/s")
+    print(
+        "latency ms: "
+        f"p50={_percentile(latencies, 50) * 1000:.2f} "
+        f"p99={_percentile(latencies, 99) * 1000:.2f} "
+        f"max={latencies[-1] * 1000 if latencies else 0.0:.2f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,27 +3,67 @@
 
 from __future__ import annotations
 
+import base64
 import json
 import random
 import secrets
-from collections import deque
-from functools import partial
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+import threading
+import time
+from array import array
+from collections import OrderedDict, deque
+from functools import lru_cache, partial, wraps
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from typing import Dict, List, Tuple
 from urllib.parse import parse_qs, urlparse
 
 ROOT_DIR = Path(__file__).parent
 STATIC_DIR = ROOT_DIR / "static"
-SIZE = 10
+SIZE = 10  # default maze size; /api/new?size=N picks another
+MIN_SIZE = 2
+MAX_SIZE = 1000
+WALL_DENSITY = 0.28
+# Highest density each generator is allowed. Random sampling keeps a first-try success
+# rate of roughly 8% or more up to 0.38. Carved mazes can't get denser than their
+# spanning tree, which is about half walls.
+MAX_WALL_DENSITY = {"random": 0.38, "carved": 0.5}
+# Bounded retries for rejection sampling; at the allowed densities failing them all is vanishingly rare.
+RANDOM_MAX_ATTEMPTS = 200
+ALGORITHMS = ("random", "carved")
+DEFAULT_ALGORITHM = "random"
+# Rejection sampling gets slow past this size; /api/new without an algorithm uses carved above it.
+RANDOM_MAX_SIZE = 128
+GRID_CACHE_SIZE = 512
+# Grids above LARGE_GRID_SIZE cost megabytes each, so they get a much smaller cache.
+LARGE_GRID_SIZE = 128
+LARGE_GRID_CACHE_SIZE = 8
+# Total maze cells all sessions may hold (~5 bytes each: grid + distance field), i.e. 16 full-size mazes.
+MAX_STORE_CELLS = 16 * MAX_SIZE * MAX_SIZE
+# Larger grids are left out of JSON states; clients fetch them from /api/grid instead.
+INLINE_GRID_LIMIT = 64
 
-_state: Dict[str, object] = {}
+
+class MazeGenerationError(RuntimeError):
+    """Raised when rejection sampling runs out of attempts for a seed."""
+
+
+def _check_maze_params(size: int, algorithm: str, wall_density: float) -> None:
+    """Raise ValueError for generator inputs the server refuses to build."""
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"unknown maze algorithm {algorithm!r}; expected one of {', '.join(ALGORITHMS)}")
+    if not MIN_SIZE <= size <= MAX_SIZE:
+        raise ValueError(f"size must be an integer between {MIN_SIZE} and {MAX_SIZE}")
+    if algorithm == "random" and size > RANDOM_MAX_SIZE:
+        raise ValueError(f"random mazes are limited to size {RANDOM_MAX_SIZE}; use algorithm=carved")
+    if not 0.0 <= wall_density <= MAX_WALL_DENSITY[algorithm]:
+        raise ValueError(f"density for {algorithm} mazes must be between 0 and {MAX_WALL_DENSITY[algorithm]}")
 
 
 def _has_path(grid: List[str]) -> bool:
     """Check if a path exists between start and goal on the current grid."""
+    size = len(grid)
     start = (0, 0)
-    goal = (SIZE - 1, SIZE - 1)
+    goal = (size - 1, size - 1)
     q: deque[Tuple[int, int]] = deque([start])
     visited = {start}
     while q:
@@ -32,85 +72,413 @@ def _has_path(grid: List[str]) -> bool:
             return True
         for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
             nx, ny = x + dx, y + dy
-            if 0 <= nx < SIZE and 0 <= ny < SIZE and grid[ny][nx] != "#" and (nx, ny) not in visited:
+            if 0 <= nx < size and 0 <= ny < size and grid[ny][nx] != "#" and (nx, ny) not in visited:
                 visited.add((nx, ny))
                 q.append((nx, ny))
     return False
 
 
-def _generate_grid(seed: int) -> List[str]:
-    """Create a seeded, reproducible 10x10 maze that keeps start/goal open."""
+def _generate_random_grid(seed: int, size: int = SIZE, wall_density: float = WALL_DENSITY) -> List[str]:
+    """Create a seeded, reproducible maze that keeps start/goal open.
+
+    Rejection sampling: scatter walls, retry until BFS finds a path. Cost grows
+    quickly with size; prefer "carved" for large mazes. Raises
+    MazeGenerationError after RANDOM_MAX_ATTEMPTS failures.
+    """
     rng = random.Random(seed)
-    wall_prob = 0.28
-    for _ in range(10_000):
+    wall_prob = wall_density
+    # The default 10x10 maze keeps its original retry schedule, which nudged the density up
+    # after each failure, so published seeds still replay. Everything else stays at the
+    # requested density, because raising it only makes a path less likely.
+    legacy = size == SIZE and wall_density == WALL_DENSITY
+    for _ in range(RANDOM_MAX_ATTEMPTS):
         grid: List[str] = []
-        for y in range(SIZE):
+        for y in range(size):
             row: List[str] = []
-            for x in range(SIZE):
-                if (x, y) in ((0, 0), (SIZE - 1, SIZE - 1)):
+            for x in range(size):
+                if (x, y) in ((0, 0), (size - 1, size - 1)):
                     row.append(".")
                 else:
                     row.append("#" if rng.random() < wall_prob else ".")
             grid.append("".join(row))
         if _has_path(grid):
             return grid
-        wall_prob = min(0.45, wall_prob + 0.02)
-    # Fallback: return an empty grid if we somehow failed to generate a valid one.
-    return ["." * SIZE for _ in range(SIZE)]
+        if legacy:
+            wall_prob = min(0.45, wall_prob + 0.02)
+    raise MazeGenerationError(
+        f"no solvable {size}x{size} random maze for seed {seed} at density {wall_density} "
+        f"after {RANDOM_MAX_ATTEMPTS} attempts; try another seed or algorithm=carved"
+    )
+
+
+def _generate_carved_grid(seed: int, size: int = SIZE, wall_density: float = WALL_DENSITY) -> List[str]:
+    """Create a seeded maze that is solvable by construction, in O(size^2).
+
+    Carves a random spanning tree (iterative DFS) over the even-coordinate
+    lattice, links the goal to it when `size` is even, then knocks out random
+    walls until the wall fraction drops to `wall_density`. Opening walls only
+    adds connections, so the start->goal path always survives.
+    """
+    rng = random.Random(seed)
+    cells = [bytearray(b"#" * size) for _ in range(size)]
+    cells[0][0] = ord(".")
+    stack = [(0, 0)]
+    while stack:
+        x, y = stack[-1]
+        options = [
+            (x + dx, y + dy)
+            for dx, dy in ((2, 0), (-2, 0), (0, 2), (0, -2))
+            if 0 <= x + dx < size and 0 <= y + dy < size and cells[y + dy][x + dx] == ord("#")
+        ]
+        if not options:
+            stack.pop()
+            continue
+        nx, ny = rng.choice(options)
+        cells[(y + ny) // 2][(x + nx) // 2] = ord(".")
+        cells[ny][nx] = ord(".")
+        stack.append((nx, ny))
+
+    last = size - 1
+    if last % 2:
+        # The goal sits off the lattice; join it to the lattice cell diagonally inside it.
+        cells[last][last] = ord(".")
+        cells[last][last - 1] = ord(".")
+
+    walls = [(x, y) for y in range(size) for x in range(size) if cells[y][x] == ord("#")]
+    rng.shuffle(walls)
+    excess = len(walls) - int(wall_density * size * size)
+    for x, y in walls[: max(0, excess)]:
+        cells[y][x] = ord(".")
+    return [row.decode("ascii") for row in cells]
+
 
+_GENERATORS = {"random": _generate_random_grid, "carved": _generate_carved_grid}
 
-def _current_state() -> Dict[str, object]:
-    return {
-        "size": SIZE,
-        "grid": _state.get("grid", []),
-        "start": _state.get("start"),
-        "goal": _state.get("goal"),
-        "agent": _state.get("agent"),
-        "distance_traveled": _state.get("distance_traveled", 0),
-        "moves": _state.get("moves", 0),
-        "seed": _state.get("seed"),
-    }
+
+def _maze_cache(func):
+    """LRU-cache a (seed, size, algorithm, wall_density) function, with a separate small cache for large mazes."""
+    small = lru_cache(maxsize=GRID_CACHE_SIZE)(func)
+    large = lru_cache(maxsize=LARGE_GRID_CACHE_SIZE)(func)
+
+    @wraps(func)
+    def cached(seed: int, size: int = SIZE, algorithm: str = DEFAULT_ALGORITHM, wall_density: float = WALL_DENSITY):
+        return (small if size <= LARGE_GRID_SIZE else large)(seed, size, algorithm, wall_density)
+
+    cached.cache_clear = lambda: (small.cache_clear(), large.cache_clear())  # type: ignore[attr-defined]
+    return cached
+
+
+@_maze_cache
+def _generate_grid(
+    seed: int, size: int = SIZE, algorithm: str = DEFAULT_ALGORITHM, wall_density: float = WALL_DENSITY
+) -> Tuple[str, ...]:
+    """Seeded maze for (seed, size, algorithm, wall_density), memoized so replayed seeds are free.
+
+    Returns a tuple so cached grids can be shared between sessions safely.
+    """
+    _check_maze_params(size, algorithm, wall_density)
+    return tuple(_GENERATORS[algorithm](seed, size, wall_density))
+
+
+@_maze_cache
+def _goal_distances(
+    seed: int, size: int = SIZE, algorithm: str = DEFAULT_ALGORITHM, wall_density: float = WALL_DENSITY
+) -> array:
+    """BFS distance to the goal for every cell (row-major, -1 for walls/unreachable).
+
+    Computed once per generated maze, so the optimal path length and per-move
+    optimality checks are O(1) lookups afterwards.
+    """
+    grid = _generate_grid(seed, size, algorithm, wall_density)
+    dist = array("i", [-1]) * (size * size)
+    goal = (size - 1) * size + (size - 1)
+    dist[goal] = 0
+    q: deque[int] = deque([goal])
+    while q:
+        idx = q.popleft()
+        y, x = divmod(idx, size)
+        d = dist[idx] + 1
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < size and 0 <= ny < size and grid[ny][nx] != "#":
+                nidx = ny * size + nx
+                if dist[nidx] < 0:
+                    dist[nidx] = d
+                    q.append(nidx)
+    return dist
 
 
-def _reset(seed: int | None = None) -> Dict[str, object]:
+_BIT_TABLE = str.maketrans({"#": "1", ".": "0"})
+
+
+@_maze_cache
+def _packed_grid(
+    seed: int, size: int = SIZE, algorithm: str = DEFAULT_ALGORITHM, wall_density: float = WALL_DENSITY
+) -> bytes:
+    """Grid as a bitmap: row-major, one bit per cell (1 = wall), MSB first, zero-padded to a byte."""
+    bits = "".join(_generate_grid(seed, size, algorithm, wall_density)).translate(_BIT_TABLE)
+    nbytes = (len(bits) + 7) // 8
+    return int(bits.ljust(nbytes * 8, "0"), 2).to_bytes(nbytes, "big")
+
+
+def _grid_id(state: Dict[str, object]) -> str:
+    # The grid is a pure function of its generator inputs, so they identify it (and make a stable ETag).
+    return f"{state.get('algorithm')}-{state.get('size')}-{state.get('wall_density')}-{state.get('seed')}"
+
+
+DIRECTIONS: Dict[str, Tuple[int, int]] = {"up": (0, -1), "down": (0, 1), "left": (-1, 0), "right": (1, 0)}
+ACTION_LETTERS = {"u": "up", "d": "down", "l": "left", "r": "right"}
+MAX_BATCH_ACTIONS = 100_000
+MAX_BATCH_BODY = 8 * 1024 * 1024
+
+
+def _current_state(state: Dict[str, object], include_static: bool = True) -> Dict[str, object]:
+    """Public view of a session. Static fields (size, grid, start, goal) are optional.
+
+    The grid itself is only inlined up to INLINE_GRID_LIMIT; `grid_id` always
+    identifies it, so clients only refetch `/api/grid` when it changes.
+    """
+    payload: Dict[str, object] = {"session": state.get("session")}
+    if include_static:
+        size = int(state.get("size", SIZE))  # type: ignore[arg-type]
+        payload.update(
+            {
+                "size": size,
+                "algorithm": state.get("algorithm", DEFAULT_ALGORITHM),
+                "wall_density": state.get("wall_density", WALL_DENSITY),
+                "grid": state.get("grid", []) if size <= INLINE_GRID_LIMIT else None,
+                "grid_id": _grid_id(state),
+                "start": state.get("start"),
+                "goal": state.get("goal"),
+                "optimal_steps": state.get("optimal_steps"),
+            }
+        )
+    payload.update(
+        {
+            "agent": state.get("agent"),
+            "distance_traveled": state.get("distance_traveled", 0),
+            "moves": state.get("moves", 0),
+            "distance_to_goal": _distance_to_goal(state),
+            "seed": state.get("seed"),
+        }
+    )
+    return payload
+
+
+def _distance_to_goal(state: Dict[str, object]) -> int | None:
+    """Remaining optimal steps from the agent's cell; a move was optimal iff this dropped by one."""
+    distances = state.get("distances")
+    agent = state.get("agent")
+    if not distances or not agent:
+        return None
+    return distances[agent["y"] * state["size"] + agent["x"]]  # type: ignore[index,operator]
+
+
+def _reset(
+    state: Dict[str, object],
+    seed: int | None = None,
+    algorithm: str = DEFAULT_ALGORITHM,
+    size: int = SIZE,
+    wall_density: float = WALL_DENSITY,
+) -> Dict[str, object]:
     chosen_seed = seed if seed is not None else secrets.randbelow(2**31)
-    grid = _generate_grid(chosen_seed)
-    _state.update(
+    grid = _generate_grid(chosen_seed, size, algorithm, wall_density)
+    distances = _goal_distances(chosen_seed, size, algorithm, wall_density)
+    state.update(
         {
             "seed": chosen_seed,
+            "size": size,
+            "algorithm": algorithm,
+            "wall_density": wall_density,
             "grid": grid,
+            "distances": distances,
+            "optimal_steps": distances[0],
             "start": {"x": 0, "y": 0},
-            "goal": {"x": SIZE - 1, "y": SIZE - 1},
+            "goal": {"x": size - 1, "y": size - 1},
             "agent": {"x": 0, "y": 0},
             "distance_traveled": 0,
             "moves": 0,
         }
     )
-    return _current_state()
+    return _current_state(state)
 
 
-def _move(direction: str) -> Dict[str, object]:
-    dir_map = {"up": (0, -1), "down": (0, 1), "left": (-1, 0), "right": (1, 0)}
-    delta = dir_map.get(direction.lower())
+def _step(state: Dict[str, object], direction: str) -> bool:
+    """Apply one move in place. Returns True if the agent actually moved."""
+    delta = DIRECTIONS.get(direction.lower())
     if not delta:
-        return _current_state()
+        return False
 
     dx, dy = delta
-    agent = _state["agent"]
+    agent = state["agent"]
     nx, ny = agent["x"] + dx, agent["y"] + dy
-    grid: List[str] = _state["grid"]  # type: ignore[assignment]
+    grid: List[str] = state["grid"]  # type: ignore[assignment]
+    size = len(grid)
+
+    moved = False
+    if 0 <= nx < size and 0 <= ny < size and grid[ny][nx] != "#":
+        state["agent"] = {"x": nx, "y": ny}
+        state["distance_traveled"] = int(state.get("distance_traveled", 0)) + 1
+        moved = True
+    state["moves"] = int(state.get("moves", 0)) + 1
+    return moved
+
+
+def _move(state: Dict[str, object], direction: str) -> Dict[str, object]:
+    _step(state, direction)
+    return _current_state(state, include_static=False)
+
+
+def _parse_actions(text: str) -> List[str]:
+    """Parse an action sequence: comma-separated names ("up,left") or letters ("UULR")."""
+    actions: List[str] = []
+    for token in text.lower().replace(" ", "").split(","):
+        if not token:
+            continue
+        if token in DIRECTIONS:
+            actions.append(token)
+            continue
+        for letter in token:
+            if letter not in ACTION_LETTERS:
+                raise ValueError(f"invalid action {letter!r}")
+            actions.append(ACTION_LETTERS[letter])
+    if len(actions) > MAX_BATCH_ACTIONS:
+        raise ValueError(f"at most {MAX_BATCH_ACTIONS} actions per request")
+    return actions
+
+
+def _apply_actions(state: Dict[str, object], actions: List[str], deltas: bool = False) -> Dict[str, object]:
+    """Run a whole action sequence with the same semantics as repeated `_move` calls.
 
-    if 0 <= nx < SIZE and 0 <= ny < SIZE and grid[ny][nx] != "#":
-        agent = {"x": nx, "y": ny}
-        _state["agent"] = agent
-        _state["distance_traveled"] = int(_state.get("distance_traveled", 0)) + 1
-    _state["moves"] = int(_state.get("moves", 0)) + 1
-    return _current_state()
+    With `deltas`, the reply carries a string with one "1"/"0" per action marking
+    whether the agent moved; callers already know the actions, so that is enough
+    to replay every intermediate position.
+    """
+    flags = [_step(state, action) for action in actions]
+    payload = _current_state(state, include_static=False)
+    if deltas:
+        payload["deltas"] = "".join("1" if moved else "0" for moved in flags)
+    return payload
+
+
+class SessionStore:
+    """Bounded, thread-safe map of session id -> game state.
+
+    Sessions idle for longer than `idle_timeout` seconds are evicted, and the
+    least recently used sessions are dropped once either `max_sessions` or
+    `max_cells` (total maze cells held, which is what drives memory: each cell
+    costs a grid byte plus a 4-byte distance) would be exceeded.
+    Each state carries its own lock so different sessions never contend.
+    """
+
+    def __init__(self, max_sessions: int = 1024, idle_timeout: float = 900.0, max_cells: int = MAX_STORE_CELLS):
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.max_cells = max_cells
+        self._sessions: OrderedDict[str, Dict[str, object]] = OrderedDict()
+        self._cells = 0
+        self._lock = threading.Lock()
+
+    def create(
+        self,
+        seed: int | None = None,
+        algorithm: str = DEFAULT_ALGORITHM,
+        size: int = SIZE,
+        wall_density: float = WALL_DENSITY,
+    ) -> Dict[str, object]:
+        """Start a new game under a fresh session id and return its public state."""
+        session_id = secrets.token_hex(8)
+        state: Dict[str, object] = {"session": session_id, "lock": threading.Lock()}
+        payload = _reset(state, seed, algorithm, size, wall_density)
+        now = time.monotonic()
+        with self._lock:
+            self._evict(now)
+            self._make_room(size * size, keep=None)
+            state["last_seen"] = now
+            state["cells"] = size * size
+            self._sessions[session_id] = state
+            self._cells += size * size
+        return payload
+
+    def reset(
+        self,
+        state: Dict[str, object],
+        seed: int | None = None,
+        algorithm: str = DEFAULT_ALGORITHM,
+        size: int = SIZE,
+        wall_density: float = WALL_DENSITY,
+    ) -> Dict[str, object]:
+        """Start a new game in an existing session, re-accounting its cells if the size changed."""
+        with state["lock"]:  # type: ignore[union-attr]
+            payload = _reset(state, seed, algorithm, size, wall_density)
+        with self._lock:
+            session_id = str(state["session"])
+            if session_id in self._sessions:
+                self._cells -= int(state["cells"])  # type: ignore[arg-type]
+                self._make_room(size * size, keep=session_id)
+                state["cells"] = size * size
+                self._cells += size * size
+        return payload
+
+    def get(self, session_id: str) -> Dict[str, object] | None:
+        now = time.monotonic()
+        with self._lock:
+            self._evict(now)
+            state = self._sessions.get(session_id)
+            if state is None:
+                return None
+            state["last_seen"] = now
+            self._sessions.move_to_end(session_id)
+            return state
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    @property
+    def cells(self) -> int:
+        with self._lock:
+            return self._cells
+
+    def _drop(self, session_id: str) -> None:
+        state = self._sessions.pop(session_id)
+        self._cells -= int(state["cells"])  # type: ignore[arg-type]
+
+    def _make_room(self, cells: int, keep: str | None) -> None:
+        # Drop least recently used sessions (never `keep`) until `cells` more fit under both limits.
+        for session_id in list(self._sessions):
+            count = len(self._sessions) - (1 if keep in self._sessions else 0)
+            if count < self.max_sessions and self._cells + cells <= self.max_cells:
+                break
+            if session_id != keep:
+                self._drop(session_id)
+
+    def _evict(self, now: float) -> None:
+        # Entries are kept in last-seen order, so expired ones sit at the front.
+        while self._sessions:
+            session_id, oldest = next(iter(self._sessions.items()))
+            if now - float(oldest["last_seen"]) <= self.idle_timeout:  # type: ignore[arg-type]
+                break
+            self._drop(session_id)
+
+
+_sessions = SessionStore()
+
+
+def _flag(qs: Dict[str, List[str]], name: str) -> bool:
+    return qs.get(name, ["0"])[0].lower() in ("1", "true", "yes")
 
 
 class MazeHandler(SimpleHTTPRequestHandler):
     """Serve the API and the static frontend."""
 
+    # Keep-alive lets agents reuse one connection for a whole episode.
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, Nagle + delayed ACK adds ~40ms per reply.
+    disable_nagle_algorithm = True
+    # Idle keep-alive connections each hold a thread; close them after this many seconds of silence.
+    timeout = 60
+
     def do_GET(self) -> None:
         parsed = urlparse(self.path)
         if parsed.path.startswith("/api/"):
@@ -124,9 +492,7 @@ class MazeHandler(SimpleHTTPRequestHandler):
     def _handle_api(self, parsed) -> None:
         qs = parse_qs(parsed.query)
         path = parsed.path
-        if path == "/api/state":
-            self._respond_json(_current_state())
-            return
+        session_id = qs.get("session", [""])[0]
         if path == "/api/new":
             seed_param = qs.get("seed", [None])[0]
             seed_value = None
@@ -135,33 +501,180 @@ class MazeHandler(SimpleHTTPRequestHandler):
                     seed_value = int(seed_param, 0)
                 except ValueError:
                     seed_value = abs(hash(seed_param)) % (2**31)
-            self._respond_json(_reset(seed_value))
+            try:
+                size = int(qs.get("size", [SIZE])[0])
+            except ValueError:
+                size = -1
+            default_algorithm = DEFAULT_ALGORITHM if size <= RANDOM_MAX_SIZE else "carved"
+            algorithm = qs.get("algorithm", [default_algorithm])[0]
+            try:
+                # Rounded so equivalent spellings share one cache entry.
+                wall_density = round(float(qs.get("density", [WALL_DENSITY])[0]), 2)
+            except ValueError:
+                wall_density = -1.0
+            try:
+                _check_maze_params(size, algorithm, wall_density)
+            except ValueError as exc:
+                self._respond_error(400, str(exc))
+                return
+            state = _sessions.get(session_id) if session_id else None
+            try:
+                if state is None:
+                    payload = _sessions.create(seed_value, algorithm, size, wall_density)
+                else:
+                    # Reuse the caller's session rather than leaking a new one per game.
+                    payload = _sessions.reset(state, seed_value, algorithm, size, wall_density)
+            except MazeGenerationError as exc:
+                self._respond_error(422, str(exc))
+                return
+            self._respond_json(payload)
+            return
+        if path == "/api/grid":
+            self._handle_grid(session_id, qs.get("format", ["bits"])[0])
+            return
+        if path in ("/api/state", "/api/move", "/api/moves"):
+            state = _sessions.get(session_id)
+            if state is None:
+                self._respond_error(404, "unknown session")
+                return
+            if path == "/api/moves":
+                try:
+                    actions = _parse_actions(qs.get("actions", [""])[0])
+                except ValueError as exc:
+                    self._respond_error(400, str(exc))
+                    return
+            with state["lock"]:  # type: ignore[union-attr]
+                if path == "/api/state":
+                    payload = _current_state(state, include_static=_flag(qs, "full"))
+                elif path == "/api/move":
+                    payload = _move(state, qs.get("dir", [""])[0])
+                else:
+                    payload = _apply_actions(state, actions, deltas=_flag(qs, "deltas"))
+            self._respond_json(payload)
             return
-        if path == "/api/move":
-            direction = qs.get("dir", [""])[0]
-            self._respond_json(_move(direction))
+        self._respond_error(404, "not found")
+
+    def _handle_grid(self, session_id: str, fmt: str) -> None:
+        """Send a session's grid compactly, honouring If-None-Match so unchanged grids aren't resent.
+
+        Formats: `bits` (raw bitmap, see `_packed_grid`), `base64` (same bitmap in
+        JSON), `rows` (list of strings, as in the state).
+        """
+        if fmt not in ("bits", "base64", "rows"):
+            self._respond_error(400, "format must be bits, base64 or rows")
+            return
+        state = _sessions.get(session_id)
+        if state is None:
+            self._respond_error(404, "unknown session")
             return
-        self.send_response(404)
+        with state["lock"]:  # type: ignore[union-attr]
+            key = (state["seed"], state["size"], state["algorithm"], state["wall_density"])
+            grid_id = _grid_id(state)
+        etag = f'"{grid_id}.{fmt}"'
+        if etag in (tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")):
+            self.send_response(304)
+            self._send_grid_headers(etag, key[1])  # type: ignore[arg-type]
+            self.end_headers()
+            return
+
+        if fmt == "bits":
+            body = _packed_grid(*key)
+            content_type = "application/octet-stream"
+        else:
+            data: object = (
+                base64.b64encode(_packed_grid(*key)).decode("ascii") if fmt == "base64" else _generate_grid(*key)
+            )
+            body = json.dumps({"grid_id": grid_id, "size": key[1], "format": fmt, "data": data}).encode("utf-8")
+            content_type = "application/json"
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self._send_grid_headers(etag, key[1])  # type: ignore[arg-type]
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_grid_headers(self, etag: str, size: int) -> None:
+        self.send_header("ETag", etag)
+        # Let browsers cache the grid but revalidate it, which is a cheap 304 when unchanged.
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("X-Maze-Size", str(size))
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Expose-Headers", "ETag, X-Maze-Size")
+
+    def do_POST(self) -> None:
+        parsed = urlparse(self.path)
+        if parsed.path != "/api/batch":
+            # The body is left unread, so the socket can't be reused for another request.
+            self.close_connection = True
+            self._respond_error(404, "not found")
+            return
+        try:
+            if "Transfer-Encoding" in self.headers:
+                raise ValueError("chunked bodies are not supported; send Content-Length")
+            length = int(self.headers.get("Content-Length", "0"))
+            if length < 0 or length > MAX_BATCH_BODY:
+                raise ValueError(f"Content-Length must be between 0 and {MAX_BATCH_BODY}")
+            request = json.loads(self.rfile.read(length) or b"{}")
+            deltas = bool(request.get("deltas", False))
+            jobs = [(str(job["session"]), _parse_actions(str(job.get("actions", "")))) for job in request["sessions"]]
+        except (ValueError, KeyError, TypeError, AttributeError) as exc:
+            # The body may be partly unread; don't try to parse the rest as a new request.
+            self.close_connection = True
+            self._respond_error(400, f"bad batch request: {exc}")
+            return
+
+        results = []
+        for session_id, actions in jobs:
+            state = _sessions.get(session_id)
+            if state is None:
+                results.append({"session": session_id, "error": "unknown session"})
+                continue
+            with state["lock"]:  # type: ignore[union-attr]
+                results.append(_apply_actions(state, actions, deltas=deltas))
+        self._respond_json({"results": results})
+
+    def _respond_error(self, status: int, message: str) -> None:
+        body = json.dumps({"error": message}).encode("utf-8")
+        self.send_response(status)
         self.send_header("Content-Type", "application/json")
         self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
-        self.wfile.write(b'{"error":"not found"}')
+        self.wfile.write(body)
 
     def _respond_json(self, payload: Dict[str, object]) -> None:
         body = json.dumps(payload).encode("utf-8")
         self.send_response(200)
         self.send_header("Content-Type", "application/json")
         self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
         self.wfile.write(body)
 
+    def log_request(self, code="-", size="-") -> None:
+        # Per-request stderr logging dominates latency under load; keep it for static files and errors.
+        if self.path.startswith("/api/") and isinstance(code, int) and code < 400:
+            return
+        super().log_request(code, size)
+
+
+class MazeServer(ThreadingHTTPServer):
+    """One thread per connection; a deep accept backlog so bursts of agents don't hit SYN retries."""
+
+    daemon_threads = True
+    request_queue_size = 128
+
 
 def main() -> None:
-    _reset()
     handler = partial(MazeHandler, directory=str(STATIC_DIR))
-    server = HTTPServer(("0.0.0.0", 8000), handler)
+    server = MazeServer(("0.0.0.0", 8000), handler)
     print("Serving maze game on http://localhost:8000")
-    print("API endpoints: /api/state, /api/new?seed=<seed>, /api/move?dir=up|down|left|right")
+    print(
+        "API endpoints: /api/new?seed=<seed>&size=<n>&algorithm=random|carved&density=<d> "
+        "(returns a session id), "
+        "/api/grid?session=<id>&format=bits|base64|rows, "
+        "/api/state?session=<id>, /api/move?session=<id>&dir=up|down|left|right"
+    )
     server.serve_forever()
 
 
@@ -0,0 +1,127 @@
+"""Reference maze solvers: BFS, A* and bidirectional BFS.
+
+Each solver takes a grid (list of row strings, "#" = wall) and returns the
+route from the top-left start to the bottom-right goal as a string of action
+letters ("U", "D", "L", "R"), ready for `/api/moves?actions=...`, or None if
+the goal is unreachable.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections import deque
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+Cell = Tuple[int, int]
+_STEPS = (("R", 1, 0), ("L", -1, 0), ("D", 0, 1), ("U", 0, -1))
+
+
+def _neighbors(grid: Sequence[str], x: int, y: int):
+    size = len(grid)
+    for letter, dx, dy in _STEPS:
+        nx, ny = x + dx, y + dy
+        if 0 <= nx < size and 0 <= ny < size and grid[ny][nx] != "#":
+            yield letter, nx, ny
+
+
+def _walk_back(parents: Dict[Cell, Tuple[Cell, str]], cell: Cell) -> List[str]:
+    """Letters from the search root to `cell`, following parent links."""
+    letters: List[str] = []
+    while cell in parents:
+        cell, letter = parents[cell]
+        letters.append(letter)
+    letters.reverse()
+    return letters
+
+
+def bfs(grid: Sequence[str]) -> Optional[str]:
+    size = len(grid)
+    start, goal = (0, 0), (size - 1, size - 1)
+    parents: Dict[Cell, Tuple[Cell, str]] = {}
+    seen = {start}
+    q: deque[Cell] = deque([start])
+    while q:
+        cell = q.popleft()
+        if cell == goal:
+            return "".join(_walk_back(parents, goal))
+        for letter, nx, ny in _neighbors(grid, *cell):
+            if (nx, ny) not in seen:
+                seen.add((nx, ny))
+                parents[(nx, ny)] = (cell, letter)
+                q.append((nx, ny))
+    return None
+
+
+def astar(grid: Sequence[str]) -> Optional[str]:
+    """A* with the Manhattan heuristic (admissible on a 4-connected grid)."""
+    size = len(grid)
+    start, goal = (0, 0), (size - 1, size - 1)
+    parents: Dict[Cell, Tuple[Cell, str]] = {}
+    best = {start: 0}
+    heap = [(2 * (size - 1), 0, start)]
+    while heap:
+        _, g, cell = heapq.heappop(heap)
+        if cell == goal:
+            return "".join(_walk_back(parents, goal))
+        if g > best[cell]:
+            continue
+        for letter, nx, ny in _neighbors(grid, *cell):
+            ng = g + 1
+            if ng < best.get((nx, ny), 1 << 62):
+                best[(nx, ny)] = ng
+                parents[(nx, ny)] = (cell, letter)
+                heapq.heappush(heap, (ng + (size - 1 - nx) + (size - 1 - ny), ng, (nx, ny)))
+    return None
+
+
+_OPPOSITE = {"U": "D", "D": "U", "L": "R", "R": "L"}
+
+
+def bidirectional_bfs(grid: Sequence[str]) -> Optional[str]:
+    """Grow BFS frontiers from both ends, always expanding the smaller one."""
+    size = len(grid)
+    start, goal = (0, 0), (size - 1, size - 1)
+    if start == goal:
+        return ""
+    fwd: Dict[Cell, Tuple[Cell, str]] = {}
+    bwd: Dict[Cell, Tuple[Cell, str]] = {}
+    fwd_seen, bwd_seen = {start}, {goal}
+    fwd_frontier, bwd_frontier = [start], [goal]
+
+    while fwd_frontier and bwd_frontier:
+        forward = len(fwd_frontier) <= len(bwd_frontier)
+        frontier = fwd_frontier if forward else bwd_frontier
+        seen, other = (fwd_seen, bwd_seen) if forward else (bwd_seen, fwd_seen)
+        parents = fwd if forward else bwd
+        nxt: List[Cell] = []
+        meet: Optional[Cell] = None
+        for cell in frontier:
+            for letter, nx, ny in _neighbors(grid, *cell):
+                if (nx, ny) in seen:
+                    continue
+                seen.add((nx, ny))
+                # Backward links store the move that leads *towards* the goal.
+                parents[(nx, ny)] = (cell, letter if forward else _OPPOSITE[letter])
+                if (nx, ny) in other:
+                    meet = (nx, ny)
+                    break
+                nxt.append((nx, ny))
+            if meet:
+                break
+        if meet:
+            head = _walk_back(fwd, meet)
+            tail = _walk_back(bwd, meet)
+            tail.reverse()
+            return "".join(head + tail)
+        if forward:
+            fwd_frontier = nxt
+        else:
+            bwd_frontier = nxt
+    return None
+
+
+SOLVERS: Dict[str, Callable[[Sequence[str]], Optional[str]]] = {
+    "bfs": bfs,
+    "astar": astar,
+    "bidirectional": bidirectional_bfs,
+}
@@ -5,26 +5,50 @@ const movesEl = document.getElementById("moves-value");
 const goalEl = document.getElementById("goal-value");
 const stateJsonEl = document.getElementById("state-json");
 const seedInput = document.getElementById("seed-input");
+const sizeInput = document.getElementById("size-input");
+const algorithmInput = document.getElementById("algorithm-input");
 const statusEl = document.getElementById("status");
 
 let state = null;
+let sessionId = sessionStorage.getItem("maze-session");
 
 async function fetchState() {
-  const res = await fetch("/api/state");
+  if (!sessionId) return newGame();
+  const res = await fetch(`/api/state?session=${encodeURIComponent(sessionId)}&full=1`);
+  if (res.status === 404) return newGame();
   state = await res.json();
+  sizeInput.value = state.size;
+  algorithmInput.value = state.algorithm;
+  await loadGrid();
   render();
 }
 
 async function newGame(seed) {
-  const q = seed ? `?seed=${encodeURIComponent(seed)}` : "";
-  const res = await fetch(`/api/new${q}`);
+  const params = new URLSearchParams();
+  if (seed) params.set("seed", seed);
+  if (sessionId) params.set("session", sessionId);
+  params.set("size", sizeInput.value || "10");
+  // The server only builds random mazes up to RANDOM_MAX_SIZE; switch to carved above that.
+  if (Number(sizeInput.value) > RANDOM_MAX_SIZE) algorithmInput.value = "carved";
+  params.set("algorithm", algorithmInput.value);
+  const res = await fetch(`/api/new?${params}`);
+  if (!res.ok) {
+    statusEl.textContent = (await res.json()).error ?? "Could not start a new game";
+    return;
+  }
   state = await res.json();
+  sessionId = state.session;
+  sessionStorage.setItem("maze-session", sessionId);
+  await loadGrid();
   render();
 }
 
 async function move(dir) {
-  const res = await fetch(`/api/move?dir=${dir}`);
-  state = await res.json();
+  const res = await fetch(`/api/move?session=${encodeURIComponent(sessionId)}&dir=${dir}`);
+  // The session may have been evicted while idle; start over rather than freezing the UI.
+  if (res.status === 404) return newGame();
+  // Moves only return the dynamic fields; keep the grid from /api/new.
+  state = { ...state, ...(await res.json()) };
   render();
 }
 
@@ -46,29 +70,113 @@ function render() {
   stateJsonEl.textContent = JSON.stringify(state, null, 2);
 }
 
-function renderGrid() {
-  gridEl.innerHTML = "";
-  if (!state || !state.grid) return;
-  state.grid.forEach((row, y) => {
-    row.split("").forEach((cell, x) => {
-      const el = document.createElement("div");
-      el.classList.add("cell");
-      if (cell === "#") el.classList.add("wall");
-      if (state.start && x === state.start.x && y === state.start.y) {
-        el.classList.add("start");
-        el.textContent = "S";
-      }
-      if (state.goal && x === state.goal.x && y === state.goal.y) {
-        el.classList.add("goal");
-        el.textContent = "G";
-      }
-      if (state.agent && x === state.agent.x && y === state.agent.y) {
-        el.classList.add("agent");
-        el.textContent = "A";
+// Cells are drawn on a canvas: one fillRect per cell for small mazes, and a
+// 1px-per-cell bitmap scaled up for large ones, so 1000x1000 stays cheap.
+const MAX_GRID_PX = 360;
+const MIN_MARKER_PX = 6; // on-screen size, so markers stay visible when the canvas is scaled down
+const RANDOM_MAX_SIZE = 128; // keep in sync with server.RANDOM_MAX_SIZE
+const ctx = gridEl.getContext("2d");
+let walls = null; // bitmap from /api/grid: row-major, 1 bit per cell, MSB first
+let wallsId = null;
+let mazeLayer = null;
+let cellPx = 1;
+let gapPx = 0;
+let displayScale = 1; // canvas px per on-screen px
+
+function color(name) {
+  return getComputedStyle(document.documentElement).getPropertyValue(name).trim();
+}
+
+function isWall(x, y) {
+  const i = y * state.size + x;
+  return (walls[i >> 3] >> (7 - (i & 7))) & 1;
+}
+
+async function loadGrid() {
+  if (!state || state.grid_id === wallsId) return;
+  // The server answers with 304 when the browser already holds this grid.
+  const res = await fetch(`/api/grid?session=${encodeURIComponent(sessionId)}&format=bits`);
+  if (!res.ok) return;
+  walls = new Uint8Array(await res.arrayBuffer());
+  wallsId = state.grid_id;
+  drawMazeLayer();
+}
+
+function drawMazeLayer() {
+  const size = state.size;
+  cellPx = Math.max(1, Math.min(36, Math.floor(MAX_GRID_PX / size)));
+  gapPx = cellPx >= 12 ? 4 : 0;
+  const px = size * cellPx - gapPx;
+  gridEl.width = px;
+  gridEl.height = px;
+  gridEl.style.width = `${Math.min(px, MAX_GRID_PX)}px`;
+  displayScale = px / Math.min(px, MAX_GRID_PX);
+
+  mazeLayer = document.createElement("canvas");
+  mazeLayer.width = px;
+  mazeLayer.height = px;
+  const layer = mazeLayer.getContext("2d");
+  if (cellPx >= 4) {
+    const tile = cellPx - gapPx;
+    const wallColor = color("--wall");
+    const openColor = color("--open");
+    for (let y = 0; y < size; y++) {
+      for (let x = 0; x < size; x++) {
+        layer.fillStyle = isWall(x, y) ? wallColor : openColor;
+        layer.fillRect(x * cellPx, y * cellPx, tile, tile);
       }
-      gridEl.appendChild(el);
-    });
-  });
+    }
+    return;
+  }
+
+  const image = layer.createImageData(size, size);
+  const wall = hexToRgb(color("--wall"));
+  const open = hexToRgb(color("--open"));
+  for (let i = 0; i < size * size; i++) {
+    const rgb = (walls[i >> 3] >> (7 - (i & 7))) & 1 ? wall : open;
+    image.data.set(rgb, i * 4);
+    image.data[i * 4 + 3] = 255;
+  }
+  const bitmap = document.createElement("canvas");
+  bitmap.width = size;
+  bitmap.height = size;
+  bitmap.getContext("2d").putImageData(image, 0, 0);
+  layer.imageSmoothingEnabled = false;
+  layer.drawImage(bitmap, 0, 0, px, px);
+}
+
+function hexToRgb(hex) {
+  const n = parseInt(hex.replace("#", ""), 16);
+  return [(n >> 16) & 255, (n >> 8) & 255, n & 255];
+}
+
+function drawMarker(pos, fill, label) {
+  if (!pos) return;
+  const tile = Math.max(1, cellPx - gapPx);
+  // Grow small markers around the cell's centre, measured in on-screen pixels.
+  const mark = Math.max(tile, MIN_MARKER_PX * displayScale);
+  const offset = (tile - mark) / 2;
+  // Clamp into the canvas so start and goal in the corners aren't clipped to a quarter.
+  const x = Math.min(Math.max(0, pos.x * cellPx + offset), gridEl.width - mark);
+  const y = Math.min(Math.max(0, pos.y * cellPx + offset), gridEl.height - mark);
+  ctx.fillStyle = fill;
+  ctx.fillRect(x, y, mark, mark);
+  if (tile >= 16) {
+    ctx.fillStyle = label === "S" ? "#e5edff" : "#0b1221";
+    ctx.font = "700 12px Segoe UI, system-ui, sans-serif";
+    ctx.textAlign = "center";
+    ctx.textBaseline = "middle";
+    ctx.fillText(label, x + mark / 2, y + mark / 2);
+  }
+}
+
+function renderGrid() {
+  if (!state || !mazeLayer) return;
+  ctx.clearRect(0, 0, gridEl.width, gridEl.height);
+  ctx.drawImage(mazeLayer, 0, 0);
+  drawMarker(state.start, color("--start"), "S");
+  drawMarker(state.goal, color("--goal"), "G");
+  drawMarker(state.agent, color("--agent"), "A");
 }
 
 function bindControls() {
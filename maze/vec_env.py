@@ -0,0 +1,144 @@
+"""In-process vectorized maze environment for RL training (requires NumPy).
+
+Runs N mazes at once as boolean wall arrays of shape (N, H, W). Mazes come
+from the server's `_generate_grid` and moves follow `_step`, so an episode
+played here with a given seed and action sequence ends in exactly the state
+the HTTP server would report. Train in-process, then score against the server.
+
+Usage (from this folder):
+
+    from vec_env import VecMazeEnv
+    env = VecMazeEnv(num_envs=64)
+    obs = env.reset(seeds=range(64))
+    obs, rewards, dones, info = env.step(actions)
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from server import DEFAULT_ALGORITHM, DIRECTIONS, SIZE, WALL_DENSITY, _generate_grid
+
+# Action ids index this tuple: 0=up, 1=down, 2=left, 3=right.
+ACTIONS = ("up", "down", "left", "right")
+_DELTAS = np.array([DIRECTIONS[name] for name in ACTIONS], dtype=np.int64)  # (4, 2) as (dx, dy)
+
+
+def grid_to_walls(grid) -> np.ndarray:
+    """Convert a list of row strings to an (H, W) boolean wall mask."""
+    return np.array([[cell == "#" for cell in row] for row in grid], dtype=bool)
+
+
+class VecMazeEnv:
+    """N independent mazes stepped with a single vectorized call.
+
+    Observations are float32 planes of shape (N, 3, H, W): walls, agent, goal.
+    Reward is `goal_reward` on the step that reaches the goal and
+    `-step_penalty` otherwise. An env whose agent reaches the goal or uses up
+    `max_moves` (default 4 * size^2) is reset in the same `step` call with the next seed from
+    `seed_rng`; its terminal values are reported in `info`.
+    """
+
+    def __init__(
+        self,
+        num_envs: int,
+        size: int = SIZE,
+        max_moves: Optional[int] = None,
+        goal_reward: float = 1.0,
+        step_penalty: float = 0.01,
+        seed: Optional[int] = None,
+        algorithm: str = DEFAULT_ALGORITHM,
+        wall_density: float = WALL_DENSITY,
+    ):
+        self.num_envs = num_envs
+        self.size = size
+        self.max_moves = max_moves if max_moves is not None else 4 * size * size
+        self.goal_reward = goal_reward
+        self.step_penalty = step_penalty
+        self.seed_rng = np.random.default_rng(seed)
+        self.algorithm = algorithm
+        self.wall_density = wall_density
+
+        self.walls = np.zeros((num_envs, size, size), dtype=bool)
+        self.seeds = np.zeros(num_envs, dtype=np.int64)
+        self.agent = np.zeros((num_envs, 2), dtype=np.int64)  # (x, y), same order as the server
+        self.goal = np.full((num_envs, 2), size - 1, dtype=np.int64)
+        self.distance_traveled = np.zeros(num_envs, dtype=np.int64)
+        self.moves = np.zeros(num_envs, dtype=np.int64)
+        self._rows = np.arange(num_envs)
+
+    def reset(self, seeds: Optional[Iterable[int]] = None) -> np.ndarray:
+        """Reset every env. `seeds` gives one maze seed per env; omitted seeds are drawn from `seed_rng`."""
+        if seeds is None:
+            seeds = self._draw_seeds(self.num_envs)
+        seeds = np.asarray(list(seeds), dtype=np.int64)
+        if seeds.shape != (self.num_envs,):
+            raise ValueError(f"expected {self.num_envs} seeds, got {seeds.shape[0]}")
+        self._reset_envs(self._rows, seeds)
+        return self.observation()
+
+    def step(self, actions) -> tuple:
+        """Apply one action per env. Returns (obs, rewards, dones, info)."""
+        actions = np.asarray(actions, dtype=np.int64)
+        if actions.shape != (self.num_envs,):
+            raise ValueError(f"expected {self.num_envs} actions, got shape {actions.shape}")
+        if np.any((actions < 0) | (actions >= len(ACTIONS))):
+            raise ValueError("actions must be in range [0, 4)")
+
+        target = self.agent + _DELTAS[actions]
+        x, y = target[:, 0], target[:, 1]
+        in_bounds = (x >= 0) & (x < self.size) & (y >= 0) & (y < self.size)
+        # Clip only for the lookup; out-of-bounds targets are already rejected by in_bounds.
+        cx = np.clip(x, 0, self.size - 1)
+        cy = np.clip(y, 0, self.size - 1)
+        free = in_bounds & ~self.walls[self._rows, cy, cx]
+
+        self.agent = np.where(free[:, None], target, self.agent)
+        self.distance_traveled += free
+        self.moves += 1
+
+        solved = np.all(self.agent == self.goal, axis=1)
+        dones = solved | (self.moves >= self.max_moves)
+        rewards = np.where(solved, self.goal_reward, -self.step_penalty).astype(np.float32)
+
+        info: Dict[str, np.ndarray] = {
+            "solved": solved,
+            "seed": self.seeds.copy(),
+            "final_agent": self.agent.copy(),
+            "distance_traveled": self.distance_traveled.copy(),
+            "moves": self.moves.copy(),
+        }
+        done_idx = np.flatnonzero(dones)
+        if done_idx.size:
+            self._reset_envs(done_idx, self._draw_seeds(done_idx.size))
+        return self.observation(), rewards, dones, info
+
+    def observation(self) -> np.ndarray:
+        obs = np.zeros((self.num_envs, 3, self.size, self.size), dtype=np.float32)
+        obs[:, 0] = self.walls
+        obs[self._rows, 1, self.agent[:, 1], self.agent[:, 0]] = 1.0
+        obs[self._rows, 2, self.goal[:, 1], self.goal[:, 0]] = 1.0
+        return obs
+
+    def state_dict(self, idx: int) -> Dict[str, object]:
+        """Env `idx` in the server's `_current_state` shape, for parity checks."""
+        return {
+            "agent": {"x": int(self.agent[idx, 0]), "y": int(self.agent[idx, 1])},
+            "distance_traveled": int(self.distance_traveled[idx]),
+            "moves": int(self.moves[idx]),
+            "seed": int(self.seeds[idx]),
+        }
+
+    def _draw_seeds(self, count: int) -> np.ndarray:
+        # Same range the server uses for random seeds.
+        return self.seed_rng.integers(0, 2**31, size=count, dtype=np.int64)
+
+    def _reset_envs(self, idx: np.ndarray, seeds: np.ndarray) -> None:
+        for i, seed in zip(idx, seeds):
+            self.walls[i] = grid_to_walls(_generate_grid(int(seed), self.size, self.algorithm, self.wall_density))
+        self.seeds[idx] = seeds
+        self.agent[idx] = 0
+        self.distance_traveled[idx] = 0
+        self.moves[idx] = 0